@@ -13,7 +13,6 @@ from typing import Any, TypedDict
 
 import ray
 import torch
-from ray.experimental.tqdm_ray import tqdm
 
 from vllm.model_executor.layers.fused_moe import fused_topk
 from vllm.model_executor.layers.fused_moe.activation import MoEActivation
@@ -93,13 +92,11 @@ class BenchmarkConfig(TypedDict):
     num_stages: int
 
 
-def benchmark_config(
-    config: BenchmarkConfig,
+def make_benchmark_tensors(
     num_tokens: int,
     num_experts: int,
     shard_intermediate_size: int,
     hidden_size: int,
-    topk: int,
     dtype: torch.dtype,
     use_fp8_w8a8: bool,
     use_int8_w8a16: bool,
@@ -107,7 +104,12 @@ def benchmark_config(
     num_iters: int = 100,
     block_quant_shape: list[int] = None,
     use_deep_gemm: bool = False,
-) -> float:
+) -> dict[str, Any]:
+    """Allocate the activation/weight/scale tensors used by benchmark_config.
+
+    Split out so that a tuning sweep can allocate them once and reuse them
+    across every config instead of re-randomizing per configuration.
+    """
     init_dtype = torch.float16 if use_fp8_w8a8 else dtype
     x = torch.randn(num_tokens, hidden_size, dtype=dtype)
     if use_int4_w4a16:
@@ -220,6 +222,63 @@ def benchmark_config(
 
     input_gating = torch.empty(num_tokens, num_experts, dtype=torch.float32)
 
+    return {
+        "x": x,
+        "w1": w1,
+        "w2": w2,
+        "gating_output": gating_output,
+        "w1_scale": w1_scale,
+        "w2_scale": w2_scale,
+        "a1_scale": a1_scale,
+        "a2_scale": a2_scale,
+        "input_gating": input_gating,
+    }
+
+
+def benchmark_config(
+    config: BenchmarkConfig,
+    num_tokens: int,
+    num_experts: int,
+    shard_intermediate_size: int,
+    hidden_size: int,
+    topk: int,
+    dtype: torch.dtype,
+    use_fp8_w8a8: bool,
+    use_int8_w8a16: bool,
+    use_int4_w4a16: bool = False,
+    num_iters: int = 100,
+    block_quant_shape: list[int] = None,
+    use_deep_gemm: bool = False,
+    tensors: dict[str, Any] | None = None,
+) -> float:
+    init_dtype = torch.float16 if use_fp8_w8a8 else dtype
+    if tensors is None:
+        tensors = make_benchmark_tensors(
+            num_tokens,
+            num_experts,
+            shard_intermediate_size,
+            hidden_size,
+            dtype,
+            use_fp8_w8a8,
+            use_int8_w8a16,
+            use_int4_w4a16=use_int4_w4a16,
+            num_iters=num_iters,
+            block_quant_shape=block_quant_shape,
+            use_deep_gemm=use_deep_gemm,
+        )
+    x = tensors["x"]
+    w1 = tensors["w1"]
+    w2 = tensors["w2"]
+    gating_output = tensors["gating_output"]
+    w1_scale = tensors["w1_scale"]
+    w2_scale = tensors["w2_scale"]
+    a1_scale = tensors["a1_scale"]
+    a2_scale = tensors["a2_scale"]
+    input_gating = tensors["input_gating"]
+    if use_deep_gemm:
+        # we use the default block shape for deepgemm
+        block_quant_shape = [128, 128]
+
     def prepare(i: int):
         input_gating.copy_(gating_output[i])
 
@@ -510,11 +569,14 @@ def need_split_k(SIZE_M, SIZE_N, SIZE_K):
 
 
 def merge_unique_dicts(list1, list2):
+    # Deduplicate via hashable keys instead of `dict in list` lookups, which
+    # are O(n^2) over the thousands of pruned ROCm configs.
     result = []
-    combined_list = list1.copy()
-    combined_list.extend(list2)
-    for dictionary in combined_list:
-        if dictionary not in result:
+    seen: set[tuple] = set()
+    for dictionary in (*list1, *list2):
+        key = tuple(sorted(dictionary.items()))
+        if key not in seen:
+            seen.add(key)
             result.append(dictionary)
     return result
 
@@ -605,6 +667,8 @@ class BenchmarkWorker:
         use_deep_gemm: bool,
     ) -> dict[str, int]:
         # local import to allow serialization by ray
+        from ray.experimental.tqdm_ray import tqdm
+
         from vllm.platforms import current_platform
 
         best_config = None
@@ -630,6 +694,21 @@ class BenchmarkWorker:
             # Ray restricts each worker to one GPU; use local index 0
             torch.accelerator.device_index(0) if need_device_guard else nullcontext()
         ):
+            # Allocate the benchmark tensors once and reuse them for every
+            # config; only the kernel launch parameters change per point.
+            tensors = make_benchmark_tensors(
+                num_tokens,
+                num_experts,
+                shard_intermediate_size,
+                hidden_size,
+                dtype,
+                use_fp8_w8a8,
+                use_int8_w8a16,
+                use_int4_w4a16=use_int4_w4a16,
+                num_iters=20,
+                block_quant_shape=block_quant_shape,
+                use_deep_gemm=use_deep_gemm,
+            )
             for idx, config in enumerate(tqdm(search_space)):
                 try:
                     kernel_time = benchmark_config(
@@ -646,6 +725,7 @@ class BenchmarkWorker:
                         num_iters=20,
                         block_quant_shape=block_quant_shape,
                         use_deep_gemm=use_deep_gemm,
+                        tensors=tensors,
                     )
                 except triton.runtime.autotuner.OutOfResources:
                     # Some configurations may be invalid and fail to compile.
@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: Copyright contributors to the vLLM project
+"""CPU-only unit tests for the coalesced staging-buffer layout used by
+`GroupCoordinator.broadcast_tensor_dict`.
+
+The sender and every receiver derive the layout independently from the
+broadcast metadata, so the layout computation must be deterministic and a
+pack/unpack round trip through the uint8 staging buffer must reproduce
+the original tensors exactly.
+"""
+
+import torch
+
+from vllm.distributed.parallel_state import (
+    _STAGING_ALIGNMENT,
+    _coalesced_tensor_layout,
+    _split_tensor_dict,
+)
+
+
+def pack_into_staging_bufs(
+    tensor_dict: dict[str, torch.Tensor],
+    layouts: dict[str, tuple[int, dict[str, int]]],
+) -> dict[str, torch.Tensor]:
+    """Pack tensors into uint8 staging buffers the way the sender does."""
+    bufs: dict[str, torch.Tensor] = {}
+    for device_type, (total_bytes, offsets) in layouts.items():
+        buf = torch.empty(total_bytes, dtype=torch.uint8)
+        for key, offset in offsets.items():
+            tensor = tensor_dict[key]
+            buf[offset : offset + tensor.nbytes].view(tensor.dtype).copy_(
+                tensor.reshape(-1)
+            )
+        bufs[device_type] = buf
+    return bufs
+
+
+def test_offsets_are_aligned_and_disjoint():
+    tensor_dict = {
+        "u8": torch.zeros(3, dtype=torch.uint8),
+        "f64": torch.zeros(5, 7, dtype=torch.float64),
+        "f32": torch.zeros(1, dtype=torch.float32),
+    }
+    metadata_list, _ = _split_tensor_dict(tensor_dict)
+    layouts = _coalesced_tensor_layout(metadata_list)
+
+    total_bytes, offsets = layouts["cpu"]
+    assert set(offsets) == set(tensor_dict)
+    spans = []
+    for key, offset in offsets.items():
+        # Aligned offsets guarantee the uint8 slice can be viewed as the
+        # tensor's dtype.
+        assert offset % _STAGING_ALIGNMENT == 0
+        end = offset + tensor_dict[key].nbytes
+        assert end <= total_bytes
+        spans.append((offset, end))
+    spans.sort()
+    for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+        assert prev_end <= next_start
+
+
+def test_empty_and_non_tensor_entries_are_excluded():
+    metadata_list, _ = _split_tensor_dict(
+        {
+            "empty": torch.empty(0, 4),
+            "obj": "not a tensor",
+            "x": torch.zeros(2, 2),
+        }
+    )
+    layouts = _coalesced_tensor_layout(metadata_list)
+    assert list(layouts) == ["cpu"]
+    assert list(layouts["cpu"][1]) == ["x"]
+
+
+def test_pack_round_trip_mixed_dtypes():
+    torch.manual_seed(0)
+    tensor_dict = {
+        "i64": torch.randint(-100, 100, (7, 3)),
+        "f16": torch.randn(4, 5, dtype=torch.float16),
+        "u8": torch.randint(0, 255, (13,), dtype=torch.uint8),
+        "bool": torch.tensor([True, False, True]),
+        # Non-contiguous tensors must be packed by logical value.
+        "strided": torch.randn(6, 8)[:, ::2],
+    }
+    metadata_list, _ = _split_tensor_dict(tensor_dict)
+    layouts = _coalesced_tensor_layout(metadata_list)
+    bufs = pack_into_staging_bufs(tensor_dict, layouts)
+
+    # Reconstruct each tensor the way the receiver does and compare.
+    for key, value in metadata_list:
+        total_bytes, offsets = layouts[value.device]
+        buf = bufs[value.device]
+        offset = offsets[key]
+        nbytes = tensor_dict[key].nbytes
+        out = buf[offset : offset + nbytes].view(value.dtype).view(value.size)
+        assert torch.equal(out, tensor_dict[key])
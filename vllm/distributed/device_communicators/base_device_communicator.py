@@ -196,6 +196,14 @@ class DeviceCommunicatorBase:
         )
         # All-gather.
         dist.all_gather_into_tensor(output_tensor, input_, group=self.device_group)
+        if dim == 0:
+            # The concat-style output already has the gathered shards
+            # contiguous along dim 0; no reshuffle needed.
+            return output_tensor
+        # NOTE: for dim != 0 the copy below is unavoidable: NCCL writes the
+        # gathered shards rank-major (shard i fills the i-th contiguous
+        # slice of the output), so no pre-strided output layout can turn
+        # the concatenation along a later dim into a zero-copy view.
         # Reshape
         output_tensor = output_tensor.reshape((self.world_size,) + input_size)
         output_tensor = output_tensor.movedim(0, dim)
@@ -268,9 +276,35 @@ class DeviceCommunicatorBase:
             # Convert negative dim to positive.
             dim += input_.dim()
 
+        # For a 2-rank group the gather degenerates to a single
+        # peer-to-peer transfer; skip the collective launch and the
+        # gather_list allocations.
+        if world_size == 2:
+            src = 1 - dst
+            if self.rank_in_group == dst:
+                recv_buf = torch.empty_like(input_)
+                torch.distributed.recv(
+                    recv_buf, src=self.ranks[src], group=self.device_group
+                )
+                tensors = [input_, recv_buf] if dst == 0 else [recv_buf, input_]
+                return torch.cat(tensors, dim=dim)
+            torch.distributed.send(input_, dst=self.ranks[dst], group=self.device_group)
+            return None
+
         # Allocate output tensor.
         if self.rank_in_group == dst:
-            gather_list = [torch.empty_like(input_) for _ in range(world_size)]
+            if dim == 0:
+                # Gather directly into contiguous slices of the final
+                # output, skipping the torch.cat copy. Only possible for
+                # dim 0, where the per-rank chunks are contiguous views.
+                output_tensor = torch.empty(
+                    (world_size * input_.shape[0],) + tuple(input_.shape[1:]),
+                    dtype=input_.dtype,
+                    device=input_.device,
+                )
+                gather_list = list(output_tensor.chunk(world_size, dim=0))
+            else:
+                gather_list = [torch.empty_like(input_) for _ in range(world_size)]
         else:
             gather_list = None
         # Gather.
@@ -278,7 +312,8 @@ class DeviceCommunicatorBase:
             input_, gather_list, dst=self.ranks[dst], group=self.device_group
         )
         if self.rank_in_group == dst:
-            output_tensor = torch.cat(gather_list, dim=dim)
+            if dim != 0:
+                output_tensor = torch.cat(gather_list, dim=dim)
         else:
             output_tensor = None
         return output_tensor
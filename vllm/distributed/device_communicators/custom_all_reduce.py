@@ -263,11 +263,13 @@ class CustomAllreduce:
             )
         return out
 
-    def custom_all_reduce(self, input: torch.Tensor) -> torch.Tensor | None:
-        """The main allreduce API that provides support for cuda graph."""
-        # When custom allreduce is disabled, this will be None.
-        if self.disabled or not self.should_custom_ar(input):
-            return None
+    def custom_all_reduce(self, input: torch.Tensor) -> torch.Tensor:
+        """The main allreduce API that provides support for cuda graph.
+
+        Callers must check `should_custom_ar(input)` first (which also
+        covers `disabled`); the dispatcher in CudaCommunicator does, so the
+        predicate is not re-evaluated here on every call.
+        """
         if self._IS_CAPTURING:
             if torch.cuda.is_current_stream_capturing():
                 return self.all_reduce(input, registered=True)
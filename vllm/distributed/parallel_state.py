@@ -25,6 +25,7 @@ If you only need to use the distributed environment without model/pipeline
 
 import contextlib
 import gc
+import math
 import pickle
 import weakref
 from collections import namedtuple
@@ -53,6 +54,7 @@ from vllm.distributed.utils import (
 from vllm.logger import init_logger
 from vllm.utils.import_utils import resolve_obj_by_qualname
 from vllm.utils.network_utils import get_distributed_init_method
+from vllm.utils.platform_utils import is_pin_memory_available
 from vllm.utils.system_utils import suppress_stdout
 from vllm.utils.torch_utils import (
     direct_register_custom_op,
@@ -69,6 +71,10 @@ class GraphCaptureContext:
 
 TensorMetadata = namedtuple("TensorMetadata", ["device", "dtype", "size"])
 
+# Sentinel broadcast in place of the metadata list when the sender's
+# tensor-dict schema is unchanged since the previous call.
+_METADATA_UNCHANGED = "METADATA_UNCHANGED"
+
 
 class Handle(Protocol):
     """Minimal async work handle used by P2P send/recv methods."""
@@ -104,6 +110,39 @@ def _split_tensor_dict(
     return metadata_list, tensor_list
 
 
+# Staging-buffer offsets must work for any dtype, so align each tensor
+# to the largest dtype width (complex128 is 16 bytes).
+_STAGING_ALIGNMENT = 16
+
+
+def _coalesced_tensor_layout(
+    metadata_list: list[tuple[str, Any]],
+) -> dict[str, tuple[int, dict[str, int]]]:
+    """Compute a contiguous uint8 staging-buffer layout for the tensors
+    described by `metadata_list`, grouped by device type.
+
+    Returns a dict mapping each device type (e.g. "cpu", "cuda") to
+    `(total_bytes, offsets)`, where `offsets` maps tensor keys to their
+    byte offset inside the staging buffer. Offsets are aligned so that a
+    uint8 slice of the buffer can be viewed as the tensor's dtype.
+    Empty tensors are excluded. Both the broadcasting and the receiving
+    ranks derive the same layout from the same metadata.
+    """
+    totals: dict[str, int] = {}
+    offsets: dict[str, dict[str, int]] = {}
+    for key, value in metadata_list:
+        if not isinstance(value, TensorMetadata):
+            continue
+        numel = math.prod(value.size)
+        if numel == 0:
+            continue
+        total = totals.get(value.device, 0)
+        total = (total + _STAGING_ALIGNMENT - 1) & ~(_STAGING_ALIGNMENT - 1)
+        offsets.setdefault(value.device, {})[key] = total
+        totals[value.device] = total + numel * value.dtype.itemsize
+    return {device: (totals[device], offsets[device]) for device in totals}
+
+
 _group_name_counter: dict[str, int] = {}
 
 
@@ -356,6 +395,11 @@ class GroupCoordinator:
         self.cpu_group = self_cpu_group
         self.device_group = self_device_group
 
+        # precomputed neighbor ranks, consulted on every pipeline-parallel
+        # send/recv
+        self._next_rank = self.ranks[(self.rank_in_group + 1) % self.world_size]
+        self._prev_rank = self.ranks[(self.rank_in_group - 1) % self.world_size]
+
         from vllm.platforms import current_platform
 
         if current_platform.is_cuda_alike():
@@ -387,6 +431,19 @@ class GroupCoordinator:
             self.mq_broadcaster = MessageQueue.create_from_process_group(
                 self.cpu_group, 1 << 22, 6
             )
+        # message queues for non-zero src ranks, created lazily by
+        # `broadcast_object` (keyed by the writer's rank in the group)
+        self._src_mq_broadcasters: dict[int, MessageQueue] = {}
+
+        # metadata caches for `broadcast_tensor_dict`: in steady state the
+        # dict schema (keys, dtypes, shapes) repeats every step, so the
+        # sender can skip re-broadcasting the pickled metadata
+        self._bcast_metadata_sent: list[tuple[str, Any]] | None = None
+        self._bcast_metadata_recv: dict[int, list[tuple[str, Any]]] = {}
+
+        # persistent staging buffers for `broadcast_tensor_dict`, keyed by
+        # device type and grown on demand
+        self._bcast_staging_bufs: dict[str, torch.Tensor] = {}
 
         # TODO(#35915): Remove is_tpu() check once tpu_inference
         # overrides use_custom_op_collectives() to return True.
@@ -400,6 +457,10 @@ class GroupCoordinator:
             and getattr(self.device_communicator, "supports_tensor_dict", False)
         )
 
+        # side stream for graph capture, lazily created on the first
+        # `graph_capture` call and reused across capture sessions
+        self._capture_stream: torch.cuda.Stream | None = None
+
     def create_mq_broadcaster(
         self, writer_rank=0, external_writer_handle=None, blocking=True
     ):
@@ -450,21 +511,19 @@ class GroupCoordinator:
     @property
     def next_rank(self):
         """Return the global rank of the process that follows the caller"""
-        rank_in_group = self.rank_in_group
-        world_size = self.world_size
-        return self.ranks[(rank_in_group + 1) % world_size]
+        return self._next_rank
 
     @property
     def prev_rank(self):
         """Return the global rank of the process that precedes the caller"""
-        rank_in_group = self.rank_in_group
-        world_size = self.world_size
-        return self.ranks[(rank_in_group - 1) % world_size]
+        return self._prev_rank
 
     @contextmanager
     def graph_capture(self, graph_capture_context: GraphCaptureContext | None = None):
         if graph_capture_context is None:
-            stream = torch.cuda.Stream()
+            if self._capture_stream is None:
+                self._capture_stream = torch.cuda.Stream()
+            stream = self._capture_stream
             graph_capture_context = GraphCaptureContext(stream)
         else:
             stream = graph_capture_context.stream
@@ -620,8 +679,17 @@ class GroupCoordinator:
         if self.world_size == 1:
             return obj
         if self.mq_broadcaster is not None:
-            assert src == 0, "Message queue broadcaster only supports src=0"
-            return self.mq_broadcaster.broadcast_object(obj)
+            if src == 0:
+                return self.mq_broadcaster.broadcast_object(obj)
+            # Lazily create a message queue with `src` as the writer. The
+            # creation is collective over the cpu group, which is safe here
+            # because `broadcast_object` is called collectively with the
+            # same `src` on all ranks.
+            src_mq = self._src_mq_broadcasters.get(src)
+            if src_mq is None:
+                src_mq = self.create_mq_broadcaster(writer_rank=src)
+                self._src_mq_broadcasters[src] = src_mq
+            return src_mq.broadcast_object(obj)
         if self.rank_in_group == src:
             torch.distributed.broadcast_object_list(
                 [obj], src=self.ranks[src], group=self.cpu_group
@@ -714,6 +782,22 @@ class GroupCoordinator:
 
         return obj
 
+    def _get_staging_buf(self, device_type: str, total_bytes: int) -> torch.Tensor:
+        """Return a persistent uint8 staging buffer of at least `total_bytes`
+        for the given device type, growing it on demand. CPU buffers use
+        pinned memory when available."""
+        buf = self._bcast_staging_bufs.get(device_type)
+        if buf is None or buf.numel() < total_bytes:
+            pin_memory = device_type == "cpu" and is_pin_memory_available()
+            buf = torch.empty(
+                total_bytes,
+                dtype=torch.uint8,
+                device=device_type,
+                pin_memory=pin_memory,
+            )
+            self._bcast_staging_bufs[device_type] = buf
+        return buf[:total_bytes]
+
     def broadcast_tensor_dict(
         self,
         tensor_dict: dict[str, torch.Tensor | Any] | None = None,
@@ -723,6 +807,9 @@ class GroupCoordinator:
     ) -> dict[str, torch.Tensor | Any] | None:
         """Broadcast the input tensor dictionary.
         NOTE: `src` is the local rank of the source rank.
+        NOTE: on non-src ranks the returned tensors are views into staging
+        buffers that are reused by the next `broadcast_tensor_dict` call on
+        this coordinator; consume or copy them before the next call.
         """
         # Bypass the function if we are using only 1 GPU.
         if not torch.distributed.is_initialized() or self.world_size == 1:
@@ -734,66 +821,100 @@ class GroupCoordinator:
 
         rank_in_group = self.rank_in_group
         if rank_in_group == src:
-            metadata_list: list[tuple[Any, Any]] = []
             assert isinstance(tensor_dict, dict), (
                 f"Expecting a dictionary, got {type(tensor_dict)}"
             )
-            metadata_list, tensor_list = _split_tensor_dict(tensor_dict)
+            metadata_list, _ = _split_tensor_dict(tensor_dict)
             # `metadata_list` lives in CPU memory.
             # `broadcast_object_list` has serialization & deserialization,
             # all happening on CPU. Therefore, we can use the CPU group.
-            self.broadcast_object(metadata_list, src=src)
+            #
+            # Skip re-broadcasting the metadata when it is identical to the
+            # previous call. Only pure-tensor dicts are cacheable: a plain
+            # python value can change without changing the metadata
+            # structure, so those must be re-sent every time.
+            cacheable = all(
+                isinstance(value, TensorMetadata) for _, value in metadata_list
+            )
+            if cacheable and metadata_list == self._bcast_metadata_sent:
+                self.broadcast_object(_METADATA_UNCHANGED, src=src)
+            else:
+                self.broadcast_object(metadata_list, src=src)
+                self._bcast_metadata_sent = metadata_list if cacheable else None
+            # Pack all tensors of the same device type into one contiguous
+            # staging buffer and issue a single broadcast per device type,
+            # instead of one (launch-bound) broadcast per tensor.
+            layouts = _coalesced_tensor_layout(metadata_list)
+            # With a single staging buffer there is nothing to overlap, so
+            # skip the Work-handle bookkeeping and broadcast synchronously.
+            use_async = len(layouts) > 1
             async_handles = []
-            for tensor in tensor_list:
-                if tensor.numel() == 0:
-                    # Skip broadcasting empty tensors.
-                    continue
-                if tensor.is_cpu:
-                    # use metadata_group for CPU tensors
-                    handle = torch.distributed.broadcast(
-                        tensor, src=self.ranks[src], group=metadata_group, async_op=True
+            for device_type, (total_bytes, offsets) in layouts.items():
+                buf = self._get_staging_buf(device_type, total_bytes)
+                for key, offset in offsets.items():
+                    tensor = tensor_dict[key]
+                    buf[offset : offset + tensor.nbytes].view(tensor.dtype).copy_(
+                        tensor.reshape(-1)
                     )
-                else:
-                    # use group for GPU tensors
-                    handle = torch.distributed.broadcast(
-                        tensor, src=self.ranks[src], group=group, async_op=True
-                    )
-                async_handles.append(handle)
+                handle = torch.distributed.broadcast(
+                    buf,
+                    src=self.ranks[src],
+                    # use metadata_group for CPU tensors
+                    group=metadata_group if device_type == "cpu" else group,
+                    async_op=use_async,
+                )
+                if use_async:
+                    async_handles.append(handle)
             for async_handle in async_handles:
                 async_handle.wait()
 
         else:
-            metadata_list = self.broadcast_object(None, src=src)
-            tensor_dict = {}
+            recv_metadata = self.broadcast_object(None, src=src)
+            if isinstance(recv_metadata, str):
+                assert recv_metadata == _METADATA_UNCHANGED
+                metadata_list = self._bcast_metadata_recv[src]
+            else:
+                metadata_list = recv_metadata
+                self._bcast_metadata_recv[src] = metadata_list
+            layouts = _coalesced_tensor_layout(metadata_list)
+            staging_bufs: dict[str, torch.Tensor] = {}
+            # With a single staging buffer there is nothing to overlap, so
+            # skip the Work-handle bookkeeping and broadcast synchronously.
+            use_async = len(layouts) > 1
             async_handles = []
+            for device_type, (total_bytes, _) in layouts.items():
+                buf = self._get_staging_buf(device_type, total_bytes)
+                handle = torch.distributed.broadcast(
+                    buf,
+                    src=self.ranks[src],
+                    # use metadata_group for CPU tensors
+                    group=metadata_group if device_type == "cpu" else group,
+                    async_op=use_async,
+                )
+                staging_bufs[device_type] = buf
+                if use_async:
+                    async_handles.append(handle)
+            for async_handle in async_handles:
+                async_handle.wait()
+            # Reconstruct the tensors as zero-copy views into the staging
+            # buffers.
+            tensor_dict = {}
             for key, value in metadata_list:
                 if isinstance(value, TensorMetadata):
-                    tensor = torch.empty(
-                        value.size, dtype=value.dtype, device=value.device
-                    )
-                    if tensor.numel() == 0:
-                        # Skip broadcasting empty tensors.
-                        tensor_dict[key] = tensor
-                        continue
-                    if tensor.is_cpu:
-                        # use metadata_group for CPU tensors
-                        handle = torch.distributed.broadcast(
-                            tensor,
-                            src=self.ranks[src],
-                            group=metadata_group,
-                            async_op=True,
-                        )
-                    else:
-                        # use group for GPU tensors
-                        handle = torch.distributed.broadcast(
-                            tensor, src=self.ranks[src], group=group, async_op=True
+                    numel = math.prod(value.size)
+                    if numel == 0:
+                        tensor_dict[key] = torch.empty(
+                            value.size, dtype=value.dtype, device=value.device
                         )
-                    async_handles.append(handle)
-                    tensor_dict[key] = tensor
+                        continue
+                    buf = staging_bufs[value.device]
+                    offset = layouts[value.device][1][key]
+                    nbytes = numel * value.dtype.itemsize
+                    tensor_dict[key] = (
+                        buf[offset : offset + nbytes].view(value.dtype).view(value.size)
+                    )
                 else:
                     tensor_dict[key] = value
-            for async_handle in async_handles:
-                async_handle.wait()
         return tensor_dict
 
     def _should_use_all_gather(
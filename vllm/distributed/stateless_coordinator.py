@@ -151,6 +151,11 @@ class StatelessGroupCoordinator(GroupCoordinator):
         self.device_group = self_device_group
         self.tcp_store_group = self_tcp_store_group
 
+        # precomputed neighbor ranks, consulted on every pipeline-parallel
+        # send/recv
+        self._next_rank = self.ranks[(self.rank_in_group + 1) % self.world_size]
+        self._prev_rank = self.ranks[(self.rank_in_group - 1) % self.world_size]
+
         if current_platform.is_cuda_alike():
             self.device = torch.device(f"cuda:{local_rank}")
         elif current_platform.is_xpu():
@@ -179,6 +184,9 @@ class StatelessGroupCoordinator(GroupCoordinator):
 
         self.mq_broadcaster = None
 
+        # used by the inherited `graph_capture`
+        self._capture_stream = None
+
         self.use_custom_op_call = (
             current_platform.is_cuda_alike() or current_platform.is_tpu()
         )
@@ -2,9 +2,11 @@
 # SPDX-FileCopyrightText: Copyright contributors to the vLLM project
 
 import math
+from functools import cache
 
 import torch
 
+import vllm.envs as envs
 from vllm.config import CompilationMode, get_current_vllm_config
 from vllm.platforms import current_platform
 
@@ -14,6 +16,14 @@ from .ScaledMMLinearKernel import (
 )
 
 
+@cache
+def _dummy_scale(device: torch.device) -> torch.Tensor:
+    # Input scaling factors are no longer optional in _scaled_mm starting
+    # from pytorch 2.5; cache the all-ones sentinel per device instead of
+    # allocating it on every call.
+    return torch.ones(1, dtype=torch.float32, device=device)
+
+
 def _get_num_tokens(output_shape: list) -> int:
     # torch._scaled_mm works with 2D tensors, so input tensors are
     # flattened if they are 3D. If output_shape is 3D, num_tokens is
@@ -79,7 +89,13 @@ class PerTensorTorchFP8ScaledMMLinearKernel(TorchFP8ScaledMMLinearKernel):
         output_shape: list,
     ) -> torch.Tensor:
         output = torch._scaled_mm(
-            A, B, out_dtype=out_dtype, scale_a=As, scale_b=Bs, bias=bias
+            A,
+            B,
+            out_dtype=out_dtype,
+            scale_a=As,
+            scale_b=Bs,
+            bias=bias,
+            use_fast_accum=envs.VLLM_FP8_USE_FAST_ACCUM,
         )
         # A fix for discrepancy in scaled_mm which returns tuple
         # for torch < 2.5 and a single value in torch >= 2.5
@@ -196,9 +212,7 @@ class ChannelWiseTorchFP8ScaledMMLinearKernel(TorchFP8ScaledMMLinearKernel):
         # For the scaled_mm fallback case, we break this down, since it
         # does not support s_w being a vector.
 
-        # Input scaling factors are no longer optional in _scaled_mm starting
-        # from pytorch 2.5. Allocating a dummy tensor to pass as scales
-        dummy_tensor = torch.ones(1, dtype=torch.float32, device=A.device)
+        dummy_tensor = _dummy_scale(A.device)
 
         # GEMM
         # This computes C = (X * W).
@@ -76,10 +76,15 @@ class BaseKVCacheMethod(QuantizeMethodBase):
             is_quantized_kv_cache(layer.kv_cache_dtype)
             and not layer.calculate_kv_scales
         ):
+            if layer.k_scale.numel() != 1 or layer.v_scale.numel() != 1:
+                raise ValueError(
+                    "Only support per-tensor scaling factor for fp8 KV cache"
+                )
+
             if layer.k_scale > 0.0 and layer.v_scale > 0.0:
                 # We prefer to use separate k_scale and v_scale if present
-                k_scale = layer.k_scale.to("cpu").tolist()
-                v_scale = layer.v_scale.to("cpu").tolist()
+                k_scale = layer.k_scale.item()
+                v_scale = layer.v_scale.item()
                 if current_platform.is_fp8_fnuz():
                     k_scale *= 2
                     v_scale *= 2
@@ -94,17 +99,12 @@ class BaseKVCacheMethod(QuantizeMethodBase):
                 # k_scale to v_scale here
                 assert layer.k_scale > 0.0
                 scale_to_duplicate = max(layer.k_scale, layer.v_scale)
-                k_scale = scale_to_duplicate.to("cpu").tolist()
-                v_scale = scale_to_duplicate.to("cpu").tolist()
+                k_scale = scale_to_duplicate.item()
+                v_scale = k_scale
                 if current_platform.is_fp8_fnuz():
                     k_scale *= 2
                     v_scale *= 2
 
-            if not isinstance(k_scale, float) or not isinstance(v_scale, float):
-                raise ValueError(
-                    "Only support per-tensor scaling factor for fp8 KV cache"
-                )
-
             if layer.q_scale < 0.0:
                 logger.warning_once(
                     "Checkpoint does not provide a q scaling factor. "
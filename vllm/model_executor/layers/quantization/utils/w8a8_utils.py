@@ -52,7 +52,9 @@ def per_tensor_dequantize(
 
 def all_close_1d(x: torch.Tensor) -> bool:
     assert len(x.shape) == 1
-    return all(torch.allclose(x[0], x[i]) for i in range(x.shape[0]))
+    # Compare against the first element in one broadcasted check rather
+    # than one allclose (and one device sync) per element.
+    return torch.allclose(x, x[0])
 
 
 def convert_to_channelwise(
@@ -94,15 +96,24 @@ def requantize_with_max_scale(
 
     # If unfused checkpoint, need requanize with the single scale.
     if unfused_module_in_checkpoint:
-        start = 0
-        for idx, logical_width in enumerate(logical_widths):
-            # Skip any component with zero width.
-            if logical_width == 0:
-                continue
-            end = start + logical_width
-            weight_dq = per_tensor_dequantize(weight[start:end, :], weight_scale[idx])
-            weight[start:end, :], _ = ops.scaled_fp8_quant(weight_dq, max_w_scale)
-            start = end
+        # Expand the per-shard scales to per-row scales and requantize all
+        # shards in one dequant + quant pass, instead of launching a
+        # dequant/quant pair (and materializing fp16 temporaries) per shard.
+        # Zero-width shards expand to zero rows and drop out naturally.
+        # Cast the per-row scales to fp16 so the dequantized product stays
+        # fp16 like the old per-shard path, instead of being promoted to a
+        # full-weight float32 temporary.
+        row_scales = (
+            torch.repeat_interleave(
+                weight_scale,
+                torch.tensor(logical_widths, device=weight_scale.device),
+            )
+            .unsqueeze(1)
+            .to(torch.float16)
+        )
+        num_rows = row_scales.shape[0]
+        weight_dq = per_tensor_dequantize(weight[:num_rows, :], row_scales)
+        weight[:num_rows, :], _ = ops.scaled_fp8_quant(weight_dq, max_w_scale)
 
     return max_w_scale, weight
 